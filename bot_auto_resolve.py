@@ -1,23 +1,36 @@
 import os
 import time
+import queue
+import atexit
 import logging
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from dotenv import load_dotenv
 from dhanhq import marketfeed
 from telegram import Bot
 
 # ======================================
 # Setup Logging
 # ======================================
+# Records are queued and written to stderr by a listener thread, so
+# logging from the tick callback never blocks on the stream.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(message)s",
-    handlers=[logging.StreamHandler()],
+    format="%(message)s",
+    handlers=[QueueHandler(_log_queue)],
 )
 log = logging.getLogger(__name__)
 
 # ======================================
 # ENV Vars (edit .env file)
 # ======================================
+load_dotenv()
 CLIENT_ID = os.getenv("DHAN_CLIENT_ID")
 ACCESS_TOKEN = os.getenv("DHAN_TOKEN")
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -35,6 +48,9 @@ SYMBOLS = {
     "TCS": ("NSE_EQ", "11536"),
 }
 
+# (segment, security id) -> symbol name, for O(1) tick lookups
+REVERSE_MAP = {(seg, sid): name for name, (seg, sid) in SYMBOLS.items()}
+
 # ======================================
 # Telegram Bot Init
 # ======================================
@@ -66,19 +82,18 @@ def on_tick(tick):
         pct = tick.get("PercentChange")
 
         # Map back to symbol name
-        for name, (s, i) in SYMBOLS.items():
-            if s == seg and i == sid:
-                latest_data[name] = (ltp, chg, pct, seg)
-                break
+        name = REVERSE_MAP.get((seg, sid))
+        if name is not None:
+            latest_data[name] = (ltp, chg, pct, seg)
     except Exception as e:
-        log.error(f"Tick processing error: {e}")
+        log.error("Tick processing error: %s", e)
 
 
 # ======================================
 # Telegram updater (every 1 min)
 # ======================================
 def send_update():
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S IST")
+    now = time.strftime("%Y-%m-%d %H:%M:%S IST")
     msg_lines = [f"LTP Update • {now}"]
 
     for name, val in latest_data.items():
@@ -112,10 +127,12 @@ def main():
     feed.on_tick = on_tick
     feed.connect()
 
-    # Run loop
+    # Run loop on a fixed 60s cadence, independent of send latency
+    next_run = time.monotonic()
     while True:
         send_update()
-        time.sleep(60)
+        next_run += 60
+        time.sleep(max(0.0, next_run - time.monotonic()))
 
 
 if __name__ == "__main__":
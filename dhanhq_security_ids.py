@@ -171,22 +171,28 @@ EXCHANGE_SEGMENTS = {
     "BSE_INDEX": "BSE Indices",
 }
 
+# ============================================
+# Lookup Tables by Stock Type
+# ============================================
+
+STOCK_LISTS = {
+    "nifty50": NIFTY50_STOCKS,
+    "midcap": MIDCAP_STOCKS,
+    "indices_nse": INDICES_NSE,
+    "indices_bse": INDICES_BSE,
+}
+
 # ============================================
 # Helper Functions
 # ============================================
 
 def get_security_id(symbol: str, stock_type: str = "nifty50") -> str:
     """
-    Get security ID for a given symbol
+    Get security ID for a given symbol (case-insensitive)
     """
-    stock_lists = {
-        "nifty50": NIFTY50_STOCKS,
-        "midcap": MIDCAP_STOCKS,
-        "indices_nse": INDICES_NSE,
-        "indices_bse": INDICES_BSE,
-    }
-    stock_dict = stock_lists.get(stock_type.lower(), NIFTY50_STOCKS)
-    return stock_dict.get(symbol.upper(), None)
+    # Tables are keyed in canonical case; only re-case on a miss
+    stock_dict = STOCK_LISTS.get(stock_type) or STOCK_LISTS.get(stock_type.lower(), NIFTY50_STOCKS)
+    return stock_dict.get(symbol) or stock_dict.get(symbol.upper())
 
 
 if __name__ == "__main__":
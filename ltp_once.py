@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 # ltp_once.py - quick test for SECURITY_IDS
 
-import os, sys, requests
+import os, re, sys, requests
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -13,22 +15,34 @@ SEC_IDS=os.getenv("SECURITY_IDS")
 if not (DHAN_TOKEN and DHAN_CLIENT_ID):
     sys.exit("Missing DHAN_TOKEN or DHAN_CLIENT_ID")
 
+# one pooled keep-alive session for all Dhan calls
+SESSION=requests.Session()
+SESSION.mount("https://",HTTPAdapter(pool_connections=4,pool_maxsize=8,max_retries=Retry(total=3,backoff_factor=0.3)))
+
+LTP_URL=urljoin("https://api.dhan.co/v2/","marketfeed/ltp")
+DHAN_HEADERS={"access-token":DHAN_TOKEN,"client-id":DHAN_CLIENT_ID,"Content-Type":"application/json"}
+LTP_KEYS=("last_price","ltp")
+# one "[SEG:]ID" entry, anchored to the start of the string or a comma
+ID_RE=re.compile(r"(?:^|(?<=,))\s*(?:([^:,]*):)?\s*(\d+)\s*(?=,|$)")
+
 def parse_ids(raw):
     payload={}
-    for p in raw.split(","):
-        if ":" in p: seg,sid=p.split(":",1)
-        else: seg,sid="NSE_EQ",p
-        try:
-            sid_i=int(sid); payload.setdefault(seg.strip().upper(),[]).append(sid_i)
-        except: pass
+    for m in ID_RE.finditer(raw):
+        seg=m.group(1)
+        seg="NSE_EQ" if seg is None else seg.strip().upper()
+        payload.setdefault(seg,[]).append(int(m.group(2)))
     return payload
 
 def call_ltp(payload):
-    url=urljoin("https://api.dhan.co/v2/","marketfeed/ltp")
-    h={"access-token":DHAN_TOKEN,"client-id":DHAN_CLIENT_ID,"Content-Type":"application/json"}
-    r=requests.post(url,headers=h,json=payload,timeout=10); r.raise_for_status()
+    r=SESSION.post(LTP_URL,headers=DHAN_HEADERS,json=payload,timeout=10); r.raise_for_status()
     return r.json()
 
+def extract_ltp(info):
+    for k in LTP_KEYS:
+        v=info.get(k)
+        if v is not None: return v
+    return None
+
 def main():
     raw=sys.argv[1] if len(sys.argv)>1 else SEC_IDS
     if not raw: sys.exit("Provide SECURITY_IDS as env or arg")
@@ -38,6 +52,6 @@ def main():
     data=resp.get("data") or resp
     for seg,m in data.items():
         for sid,info in m.items():
-            print(seg,sid,"->",info.get("last_price") or info.get("ltp"))
+            print(seg,sid,"->",extract_ltp(info))
 
 if __name__=="__main__": main()